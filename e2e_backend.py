@@ -0,0 +1,76 @@
+"""
+Backend facts shared by the CFO Platform E2E harness and its stand-ins
+======================================================================
+The seeded tenant and users, the ThrottlerGuard configuration and the DTO
+fields test-company-e2e.py and StandInBackend (e2e_stand_in.py) both rely on.
+"""
+
+from typing import Dict
+
+TENANT_NAME = "admin"  # Use existing 'admin' tenant
+COMPANY_NAME = "Admin Tenant"  # For testing with existing tenant
+
+# Backend throttler (backend/src/config/throttle.config.ts, @nestjs/throttler 6).
+# Every named throttler applies to every handler, counted per handler and
+# client IP, so a route's effective limit is the lowest of them.
+THROTTLERS = {  # Named throttler limits per window, by backend NODE_ENV
+    "dev": {"default": 300, "auth": 20, "etl": 100, "strict": 20},
+    "prod": {"default": 120, "auth": 10, "etl": 50, "strict": 5},
+}
+THROTTLE_OVERRIDES = {  # @Throttle(...) on individual handlers
+    ("POST", "/auth/login"): {"auth": 5},
+    ("POST", "/auth/refresh"): {"auth": 5},
+    ("POST", "/etl/import"): {"etl": 20},
+}
+THROTTLE_SKIPS = [  # (path prefixes, throttlers skipped); bare @SkipThrottle() skips "default" only
+    (("/health", "/api/health"), ("default",)),
+]
+THROTTLE_RETRY_AFTER = 60  # Seconds; ThrottlerExceptionFilter's Retry-After
+RATE_LIMIT_WINDOW = 60.0  # Seconds; the throttler TTL for every class
+
+CASHFLOW_FIELDS = [  # Editable cells of a forecast week (UpdateCashFlowLineItemDto)
+    f"{activity}_cash_{direction}" for activity in ("operating", "investing", "financing")
+    for direction in ("inflow", "outflow")
+]
+
+# Test Users
+USERS = {
+    "super_admin": {
+        "username": "kc-superadmin",
+        "password": "Secret123!",
+        "email": "superadmin@system.local",
+        "demo_token": "demo-token-super-admin"
+    },
+    "company_admin": {
+        "username": "admin@acme-corp.com",
+        "password": "Admin123!",
+        "email": "admin@acme-corp.com",
+        "demo_token": "demo-token-admin",
+        "role": "admin"
+    },
+    "analyst": {
+        "username": "analyst@acme-corp.com",
+        "password": "Analyst123!",
+        "email": "analyst@acme-corp.com",
+        "demo_token": "demo-token-analyst",
+        "role": "analyst"
+    },
+    "viewer": {
+        "username": "viewer@acme-corp.com",
+        "password": "Viewer123!",
+        "email": "viewer@acme-corp.com",
+        "demo_token": "demo-token-viewer",
+        "role": "viewer"
+    }
+}
+
+
+def throttler_limits(profile: str, method: str, path: str) -> Dict[str, int]:
+    """Limit of each named throttler guarding a handler, after @Throttle / @SkipThrottle"""
+    limits = dict(THROTTLERS[profile])
+    limits.update(THROTTLE_OVERRIDES.get((method, path), {}))
+    for prefixes, skipped in THROTTLE_SKIPS:
+        if path.startswith(prefixes):
+            for name in skipped:
+                limits.pop(name, None)
+    return limits
@@ -0,0 +1,264 @@
+"""
+Redis stand-in for the CFO Platform E2E harness (test-company-e2e.py)
+=====================================================================
+RedisStandIn serves the RESP2 commands the backend's RedisThrottlerStorage
+uses, so a real backend or StandInBackend can keep throttle counters in it;
+RedisConnection is the pipelining client StandInBackend talks to it with.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+REDIS_STAND_IN_PORT = 0  # 0 picks a free port; use 6379 to serve a real backend's REDIS_PORT
+
+
+class RedisStandIn:
+    """Minimal in-memory Redis (RESP2) for the backend's RedisThrottlerStorage
+    
+    Serves the commands RedisThrottlerStorage and the ioredis handshake use
+    (GET, SET PX/EX/NX, INCR, PTTL, PEXPIRE, DEL, INFO, PING, SELECT,
+    CLIENT), so a real backend can run with REDIS_HOST / REDIS_PORT pointed
+    here and the stand-in backend can keep its throttle counters here.
+    Every reply is delayed by latency_ms to model the network hop to Redis,
+    and every command is counted, so storage round trips per request can be reported.
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = REDIS_STAND_IN_PORT, latency_ms: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.data: Dict[bytes, bytes] = {}
+        self.expires: Dict[bytes, float] = {}  # Key -> time.monotonic() deadline
+        self.commands: Dict[str, int] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stopping: Optional[asyncio.Event] = None
+        self.ready = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def address(self) -> tuple:
+        return self.host, self.port
+    
+    @property
+    def total_commands(self) -> int:
+        return sum(self.commands.values())
+    
+    def start(self) -> "RedisStandIn":
+        """Serve on a daemon thread with its own event loop; returns once listening"""
+        self.thread = threading.Thread(target=asyncio.run, args=(self.serve(),), daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        return self
+    
+    def stop(self):
+        if self.loop and self.stopping:
+            self.loop.call_soon_threadsafe(self.stopping.set)
+            self.thread.join(timeout=5)
+    
+    async def serve(self):
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        async with server:
+            await self.stopping.wait()
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    args = await self.read_command(reader)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+                    break
+                if not args:
+                    continue
+                name = args[0].decode("latin-1").upper()
+                self.commands[name] = self.commands.get(name, 0) + 1
+                reply = self.execute(name, args[1:])
+                if self.latency_ms:
+                    # Delay the reply, not the connection, so pipelined commands overlap
+                    self.loop.call_later(self.latency_ms / 1000, writer.write, reply)
+                else:
+                    writer.write(reply)
+                    await writer.drain()
+                if name == "QUIT":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    @staticmethod
+    async def read_command(reader: asyncio.StreamReader) -> List[bytes]:
+        line = await reader.readuntil(b"\r\n")
+        if not line.startswith(b"*"):
+            return line.split()  # Inline command (redis-cli, telnet)
+        args = []
+        for _ in range(int(line[1:])):
+            size = int((await reader.readuntil(b"\r\n"))[1:])
+            args.append((await reader.readexactly(size + 2))[:-2])
+        return args
+    
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    
+    def execute(self, name: str, args: List[bytes]) -> bytes:
+        handler = self.COMMANDS.get(name)
+        if handler is None:
+            return self.error(f"ERR unknown command '{name}'")
+        try:
+            return handler(self, *args)
+        except (TypeError, ValueError, IndexError):
+            return self.error(f"ERR wrong arguments for '{name}'")
+    
+    def live(self, key: bytes) -> bool:
+        """Whether key exists, dropping it first if its TTL has passed"""
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+    
+    @staticmethod
+    def error(message: str) -> bytes:
+        return f"-{message}\r\n".encode()
+    
+    @staticmethod
+    def integer(value: int) -> bytes:
+        return f":{value}\r\n".encode()
+    
+    @staticmethod
+    def bulk(value: Optional[bytes]) -> bytes:
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+    
+    def command_get(self, key: bytes) -> bytes:
+        return self.bulk(self.data[key] if self.live(key) else None)
+    
+    def command_set(self, key: bytes, value: bytes, *options: bytes) -> bytes:
+        options = [option.upper() for option in options]
+        exists = self.live(key)
+        if (b"NX" in options and exists) or (b"XX" in options and not exists):
+            return self.bulk(None)
+        self.data[key] = value
+        self.expires.pop(key, None)
+        for unit, scale in ((b"PX", 1000), (b"EX", 1)):
+            if unit in options:
+                self.expires[key] = time.monotonic() + int(options[options.index(unit) + 1]) / scale
+        return b"+OK\r\n"
+    
+    def command_incr(self, key: bytes) -> bytes:
+        value = int(self.data[key]) + 1 if self.live(key) else 1
+        self.data[key] = str(value).encode()
+        return self.integer(value)
+    
+    def command_pttl(self, key: bytes) -> bytes:
+        if not self.live(key):
+            return self.integer(-2)
+        if key not in self.expires:
+            return self.integer(-1)
+        return self.integer(max(0, int((self.expires[key] - time.monotonic()) * 1000)))
+    
+    def command_pexpire(self, key: bytes, milliseconds: bytes) -> bytes:
+        if not self.live(key):
+            return self.integer(0)
+        self.expires[key] = time.monotonic() + int(milliseconds) / 1000
+        return self.integer(1)
+    
+    def command_del(self, *keys: bytes) -> bytes:
+        removed = [key for key in keys if self.live(key)]
+        for key in removed:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.integer(len(removed))
+    
+    def command_dbsize(self) -> bytes:
+        return self.integer(sum(1 for key in list(self.data) if self.live(key)))
+    
+    def command_flushall(self, *options: bytes) -> bytes:
+        self.data.clear()
+        self.expires.clear()
+        return b"+OK\r\n"
+    
+    def command_info(self, *sections: bytes) -> bytes:
+        return self.bulk(b"# Server\r\nredis_version:7.2.0\r\nredis_mode:standalone\r\n"
+                         b"# Persistence\r\nloading:0\r\n")
+    
+    def command_ping(self, *message: bytes) -> bytes:
+        return self.bulk(message[0]) if message else b"+PONG\r\n"
+    
+    def command_ok(self, *args: bytes) -> bytes:
+        return b"+OK\r\n"
+    
+    COMMANDS = {
+        "GET": command_get, "SET": command_set, "INCR": command_incr, "PTTL": command_pttl,
+        "PEXPIRE": command_pexpire, "DEL": command_del, "DBSIZE": command_dbsize,
+        "FLUSHALL": command_flushall, "FLUSHDB": command_flushall, "INFO": command_info,
+        "PING": command_ping, "SELECT": command_ok, "CLIENT": command_ok, "QUIT": command_ok,
+    }
+    
+    def print_stats(self):
+        calls = ", ".join(f"{name} {count:,}" for name, count in sorted(self.commands.items()))
+        print(f"Redis stand-in: {self.total_commands:,} commands ({calls or 'none'}), "
+              f"{sum(1 for key in list(self.data) if self.live(key)):,} live keys")
+
+
+class RedisConnection:
+    """Pipelining RESP2 client on asyncio streams
+    
+    Like ioredis, one connection carries every caller's commands: they are
+    written as soon as they are issued and replies are matched to callers
+    in order, so concurrent requests overlap their round trips.
+    """
+    
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.pending: deque = deque()  # Futures awaiting replies, in send order
+        self.reader_task: Optional[asyncio.Task] = None
+    
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.reader_task = asyncio.create_task(self.read_replies())
+    
+    async def execute(self, *commands: tuple) -> List[Any]:
+        """Send one or more commands in a single write and return their replies"""
+        payload = b"".join(
+            b"*%d\r\n" % len(command) + b"".join(
+                b"$%d\r\n%s\r\n" % (len(arg), arg) for arg in (str(part).encode() for part in command)
+            )
+            for command in commands
+        )
+        futures = [asyncio.get_running_loop().create_future() for _ in commands]
+        self.pending.extend(futures)
+        self.writer.write(payload)
+        await self.writer.drain()
+        return [await future for future in futures]
+    
+    async def read_replies(self):
+        try:
+            while True:
+                reply = await self.read_reply()
+                self.pending.popleft().set_result(reply)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            while self.pending:
+                self.pending.popleft().set_exception(ConnectionError(f"Redis connection lost: {e}"))
+    
+    async def read_reply(self) -> Any:
+        line = (await self.reader.readuntil(b"\r\n"))[:-2]
+        kind, rest = line[:1], line[1:]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            return RuntimeError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            return None if int(rest) < 0 else (await self.reader.readexactly(int(rest) + 2))[:-2]
+        return [await self.read_reply() for _ in range(int(rest))]
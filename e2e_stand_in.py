@@ -0,0 +1,838 @@
+"""
+Stand-in backend for the CFO Platform E2E harness (test-company-e2e.py)
+=======================================================================
+An in-process asyncio HTTP/1.1 server with an in-memory store that answers
+the backend's controller routes, so the suite, load modes and benchmarks
+run without NestJS, Postgres or Keycloak (--stand-in).
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from e2e_backend import (
+    CASHFLOW_FIELDS, COMPANY_NAME, RATE_LIMIT_WINDOW, TENANT_NAME, THROTTLE_RETRY_AFTER, USERS, throttler_limits
+)
+from e2e_redis import RedisConnection
+
+# Stand-in backend (--stand-in)
+STAND_IN_LOGIN_LIMIT = 5  # Failed logins per client before 429
+STAND_IN_LOGIN_WINDOW = 60  # Seconds; also sent as Retry-After
+STAND_IN_TOKEN_TTL = 300  # Seconds; expires_in of issued tokens
+STAND_IN_MAX_TRANSACTIONS = 10000  # Transaction rows kept per ETL import
+
+
+class StandInBackend:
+    """In-process stand-in for the NestJS API (asyncio HTTP/1.1, in-memory store)
+    
+    Lets the suite, load generator and benchmarks run without NestJS,
+    Postgres or Keycloak. Only the backend's controller routes (ROUTES)
+    exist; any other method and path is a 404, so a green stand-in run
+    does not hide calls to endpoints the API lacks. Behind those routes
+    resources are generic: POST /a/b creates a row in collection /a/b,
+    GET /a/b lists it (query params filter on fields), GET/PUT/PATCH/DELETE
+    /a/b/:id address one row and PUT/PATCH /a/b/:id/<field> merge the body
+    into that row. Collections are scoped by x-tenant-id except under
+    /super-admin. The few routes whose behaviour the harness depends on
+    (login, tenants, ETL import/approve/post, analytics, default scenarios,
+    projections) have dedicated handlers. Financial statements follow
+    FinancialController: {statement, lineItems} responses, a 500 for a body
+    without line_items and a 409 for a second statement with the same
+    STATEMENT_KEY. Report reads without their REPORT_PARAMS are a 400.
+    
+    Every request is delayed by latency_ms (+/- jitter_ms) and fails with
+    error_status at error_rate, so harness overhead and error handling can
+    be measured in isolation. With a throttle profile, requests pass the
+    backend's ThrottlerGuard rules (THROTTLERS, per handler and client IP)
+    first, counted in a RedisStandIn like RedisThrottlerStorage does, or
+    in memory without one.
+    """
+    
+    GLOBAL_PREFIXES = ("/super-admin",)  # Not scoped by x-tenant-id
+    PUBLIC_PATHS = ("/health", "/health/ready", "/health/details")  # No auth, no tenant
+    STATEMENT_KEY = ("statement_type", "period_start", "period_end", "scenario")  # Per-tenant UNIQUE constraint
+    REPORT_PARAMS = {  # ReportsController query parameters; any missing one is a 400
+        "/reports/variance": ("actual_statement_id", "projection_id", "period_number"),
+        "/reports/export/variance": ("actual_statement_id", "projection_id", "period_number"),
+        "/reports/trend": ("line_code", "start_date", "end_date"),
+        "/reports/summary": ("type", "start_date", "end_date"),
+        "/reports/budget-vs-actual": ("budget_id", "statement_id"),
+    }
+    ROUTES = (  # Every handler in backend/src/**/*.controller.ts; anything else is a 404 like Nest's router
+        "POST /admin/init", "POST /admin/init/tenant", "POST /admin/config", "GET /admin/config/:key",
+        "GET /admin/config", "DELETE /admin/config/:key", "POST /admin/etl-params", "GET /admin/etl-params/:name",
+        "GET /admin/etl-params", "DELETE /admin/etl-params/:id", "POST /admin/approvals", "GET /admin/approvals",
+        "PUT /admin/approvals/:tenantId/approve", "PUT /admin/approvals/:tenantId/reject", "POST /admin/audit",
+        "GET /admin/audit",
+        "POST /ai/query",
+        "POST /auth/login", "POST /auth/refresh", "GET /auth/me",
+        "POST /billing/init", "GET /billing/summary", "GET /billing/plans", "GET /billing/subscription",
+        "POST /billing/subscription", "PUT /billing/subscription/cancel", "GET /billing/invoices",
+        "GET /billing/invoices/:id", "POST /billing/invoices", "PUT /billing/invoices/:id/pay",
+        "GET /billing/payments", "POST /billing/payments", "GET /billing/usage", "POST /billing/usage",
+        "GET /budgets", "GET /budgets/:id", "POST /budgets", "PUT /budgets/:id", "DELETE /budgets/:id",
+        "GET /budgets/:id/line-items", "POST /budgets/:id/line-items", "PUT /budgets/:id/line-items/:lineItemId",
+        "DELETE /budgets/:id/line-items/:lineItemId", "POST /budgets/:id/submit", "POST /budgets/:id/approve",
+        "POST /budgets/:id/reject", "POST /budgets/:id/lock", "POST /budgets/copy", "GET /budgets/:id/allocations",
+        "GET /budgets/:id/summary", "GET /budgets/:id/department-summary",
+        "GET /cashflow/forecasts", "GET /cashflow/forecasts/:id", "POST /cashflow/forecasts",
+        "PUT /cashflow/forecasts/:id", "DELETE /cashflow/forecasts/:id", "GET /cashflow/forecasts/:id/line-items",
+        "PUT /cashflow/forecasts/:id/line-items/:week", "PUT /cashflow/forecasts/:id/line-items",
+        "GET /cashflow/forecasts/:id/summary", "GET /cashflow/categories",
+        "GET /coa", "GET /coa/hierarchy", "GET /coa/search", "GET /coa/templates", "GET /coa/templates/:id/accounts",
+        "POST /coa/templates/:id/apply", "GET /coa/:code", "POST /coa", "PUT /coa/:code", "DELETE /coa/:code",
+        "GET /tenants", "GET /tenants/:id",
+        "POST /consolidation/consolidate",
+        "POST /dim/init", "POST /dim/dimensions", "GET /dim/dimensions", "GET /dim/dimensions/:code",
+        "POST /dim/dimensions/:code/hierarchy", "GET /dim/dimensions/:code/hierarchy",
+        "GET /dim/dimensions/:code/hierarchy/:parent", "DELETE /dim/dimensions/:code/hierarchy/:node",
+        "POST /dim/templates", "GET /dim/templates", "GET /dim/templates/default/:type", "GET /dim/templates/:id",
+        "POST /dim/templates/:id/validate", "DELETE /dim/templates/:id",
+        "POST /dsr/requests", "GET /dsr/requests", "GET /dsr/requests/:id", "PUT /dsr/requests/:id/approve",
+        "POST /dsr/requests/:id/process", "GET /dsr/requests/:id/audit-log", "GET /dsr/statistics",
+        "POST /dsr/public/request",
+        "GET /etl/templates", "GET /etl/templates/:id/download", "GET /etl/templates/:id", "POST /etl/templates",
+        "PUT /etl/templates/:id", "GET /etl/imports", "GET /etl/imports/:id", "POST /etl/import",
+        "GET /etl/transactions", "PUT /etl/transactions/:id", "DELETE /etl/transactions/:id",
+        "POST /etl/transactions/approve", "GET /etl/mapping-rules", "POST /etl/transactions/:id/apply-mapping",
+        "POST /etl/transactions/post-to-financials", "GET /etl/financials/:statementId/transactions-summary",
+        "GET /etl/scenarios", "POST /etl/post-to-financials", "POST /etl/import/excel", "POST /etl/import/csv",
+        "POST /etl/preview/excel", "POST /etl/preview/csv", "GET /etl/import/:id/log", "GET /etl/import/history",
+        "POST /financial/statements", "GET /financial/statements/:id", "GET /financial/statements",
+        "PUT /financial/statements/:id/status", "PUT /financial/statements/:id", "DELETE /financial/statements/:id",
+        "GET /financial/line-items/:lineCode/transactions", "GET /financial/statements/:id/transactions",
+        "GET /health", "GET /health/ready", "GET /health/details",
+        "POST /projections/generate", "GET /projections/list", "GET /projections/:id",
+        "GET /reports/variance", "GET /reports/trend", "GET /reports/summary", "GET /reports/budget-vs-actual",
+        "GET /reports/export/variance",
+        "POST /scenarios", "GET /scenarios/:id", "GET /scenarios", "PUT /scenarios/:id", "DELETE /scenarios/:id",
+        "POST /scenarios/defaults",
+        "GET /super-admin/system-users", "POST /super-admin/system-users", "PUT /super-admin/system-users/:id/role",
+        "PUT /super-admin/system-users/:id/status", "DELETE /super-admin/system-users/:id", "GET /super-admin/users",
+        "GET /super-admin/users/:id", "POST /super-admin/users", "PUT /super-admin/users/:id",
+        "GET /super-admin/users/:id/tenants", "POST /super-admin/users/:userId/tenants/:tenantId",
+        "DELETE /super-admin/users/:userId/tenants/:tenantId", "GET /super-admin/tenants",
+        "GET /super-admin/tenants/:id", "GET /super-admin/tenants/:id/users", "POST /super-admin/tenants",
+        "DELETE /super-admin/tenants/:id", "GET /super-admin/analytics/overview",
+        "GET /super-admin/analytics/tenants/:id/stats", "GET /super-admin/me",
+        "GET /my-tenants",
+        "POST /tenant", "GET /tenant", "GET /tenant/:id", "PUT /tenant/:id", "DELETE /tenant/:id",
+        "POST /users/init", "POST /users", "GET /users/email/:email", "GET /users", "PUT /users/:id/role",
+        "PUT /users/:id/deactivate", "GET /users/company/profile", "POST /users/company/profile",
+        "POST /users/invite", "GET /users/invitations", "POST /users/accept-invitation",
+        "POST /users/transfer-ownership", "POST /users/transfer-ownership/accept",
+        "POST /users/transfer-ownership/reject", "POST /users/transfer-ownership/:id/cancel",
+        "GET /users/transfer-ownership/pending", "GET /users/transfer-ownership/all", "GET /users/profile/me",
+        "PUT /users/profile/me",
+        "GET /version-control/versions", "GET /version-control/versions/:objectType/:objectId",
+        "GET /version-control/versions/:objectType/:objectId/:versionNumber", "POST /version-control/versions",
+        "POST /version-control/versions/:objectType/:objectId/compare",
+        "POST /version-control/versions/:objectType/:objectId/restore", "GET /version-control/policies/:objectType",
+        "PUT /version-control/policies/:objectType", "POST /version-control/cleanup/:objectType",
+        "GET /version-control/stats",
+        "POST /workflow/init", "POST /workflow/chains", "GET /workflow/chains/:id", "GET /workflow/chains",
+        "DELETE /workflow/chains/:id", "POST /workflow/requests", "GET /workflow/requests/:id",
+        "GET /workflow/requests", "POST /workflow/requests/:id/actions", "PUT /workflow/requests/:id/cancel",
+        "GET /workflow/notifications", "PUT /workflow/notifications/:id/read",
+    )
+    REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+               404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error",
+               503: "Service Unavailable"}
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        throttle: Optional[str] = None,
+        redis_address: Optional[tuple] = None
+    ):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.collections: Dict[tuple, Dict[str, Dict]] = {}
+        self.tokens = {user["demo_token"]: role for role, user in USERS.items()}
+        self.refresh_tokens: Dict[str, str] = {}
+        self.failed_logins: Dict[str, List[float]] = {}
+        self.throttle = throttle
+        self.throttle_off = False  # Skip the guard (unthrottled baseline runs)
+        self.redis = RedisConnection(*redis_address) if redis_address else None
+        self.throttle_counts: Dict[str, tuple] = {}  # Key -> (hits, window reset), without Redis
+        self.requests_throttled = 0
+        self.requests_served = 0
+        self.errors_injected = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stopping: Optional[asyncio.Event] = None
+        self.ready = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.routes = [
+            (method, path, re.compile(re.sub(r":[A-Za-z]+", "[^/]+", path) + "$"))
+            for method, path in (route.split(" ", 1) for route in self.ROUTES)
+        ]
+        self.store(None, "/super-admin/tenants", {"id": TENANT_NAME, "tenant_id": TENANT_NAME,
+                                                   "company_name": COMPANY_NAME, "status": "active"})
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    
+    def start(self) -> "StandInBackend":
+        """Serve on a daemon thread with its own event loop; returns once listening"""
+        self.thread = threading.Thread(target=asyncio.run, args=(self.serve(),), daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        return self
+    
+    def stop(self):
+        if self.loop and self.stopping:
+            self.loop.call_soon_threadsafe(self.stopping.set)
+            self.thread.join(timeout=5)
+    
+    async def serve(self):
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        if self.redis:
+            await self.redis.connect()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        async with server:
+            await self.stopping.wait()
+    
+    # ------------------------------------------------------------------
+    # HTTP/1.1 (keep-alive, Content-Length or chunked request bodies)
+    # ------------------------------------------------------------------
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = (writer.get_extra_info("peername") or ("local",))[0]
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers and "transfer-encoding" in headers:
+                    # Node's HTTP parser refuses ambiguous framing and drops the connection
+                    data = json.dumps(self.error(400, "Content-Length with Transfer-Encoding")[1]).encode()
+                    writer.write(f"HTTP/1.1 400 Bad Request\r\nContent-Type: application/json\r\n"
+                                 f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+                    await writer.drain()
+                    break
+                body = await self.read_body(reader, headers)
+                
+                status, payload, extra = await self.respond(method, target, headers, body, client)
+                data = json.dumps(payload).encode()
+                lines = [f"HTTP/1.1 {status} {self.REASONS.get(status, 'Unknown')}",
+                         "Content-Type: application/json",
+                         f"Content-Length: {len(data)}"]
+                lines += [f"{name}: {value}" for name, value in extra.items()]
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    @staticmethod
+    async def read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    await reader.readline()
+                    return b"".join(chunks)
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+        length = int(headers.get("content-length") or 0)
+        return await reader.readexactly(length) if length else b""
+    
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+    
+    async def respond(self, method: str, target: str, headers: Dict[str, str], body: bytes, client: str) -> tuple:
+        """Apply latency / error injection, then route; returns (status, payload, headers)"""
+        self.requests_served += 1
+        if self.latency_ms or self.jitter_ms:
+            delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+            await asyncio.sleep(max(delay, 0.0) / 1000)
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.errors_injected += 1
+            # Short Retry-After on injected 429s so client back-off is exercised without stalling
+            retry = {"Retry-After": "1"} if self.error_status == 429 else {}
+            return self.error(self.error_status, "Injected failure") + (retry,)
+        
+        path, _, query_string = target.partition("?")
+        path = path.rstrip("/") or "/"
+        query = dict(pair.partition("=")[::2] for pair in query_string.split("&") if pair)
+        handler = self.handler_path(method, path)
+        if handler is None:
+            return self.error(404, f"Cannot {method} {path}") + ({},)
+        
+        if self.throttle and not self.throttle_off and await self.throttled(method, handler, client):
+            self.requests_throttled += 1
+            return self.error(429, "ThrottlerException: Too Many Requests") + (
+                {"Retry-After": str(THROTTLE_RETRY_AFTER)},)
+        
+        if path == "/auth/login" and method == "POST":
+            return self.login(body, client)
+        if path == "/auth/refresh" and method == "POST":
+            return self.refresh(body)
+        if path in self.PUBLIC_PATHS:
+            return 200, {"status": "ok", "uptime": time.perf_counter()}, {}
+        
+        role = self.tokens.get(headers.get("authorization", "").replace("Bearer ", "", 1))
+        if role is None:
+            return self.error(401, "Unauthorized") + ({},)
+        if role == "viewer" and method != "GET":
+            return self.error(403, "Forbidden resource") + ({},)
+        
+        tenant = None if path.startswith(self.GLOBAL_PREFIXES) else headers.get("x-tenant-id", TENANT_NAME)
+        try:
+            payload = self.json_body(body, headers)
+        except ValueError:
+            return self.error(400, "Malformed JSON body") + ({},)
+        if method == "POST" and re.fullmatch(r"/workflow/requests/[^/]+/actions", path):
+            return await self.workflow_action(tenant, path.split("/")[3], payload, role) + ({},)
+        return self.route(method, path, query, payload, body, headers, tenant) + ({},)
+    
+    def handler_path(self, method: str, path: str) -> Optional[str]:
+        """The ROUTES path (/a/:id) of the handler serving method and path, or None"""
+        return next((route for route_method, route, pattern in self.routes
+                     if method == route_method and pattern.match(path)), None)
+    
+    async def throttled(self, method: str, handler: str, client: str) -> bool:
+        """ThrottlerGuard: count the request against each throttler on its handler, stopping at the first block"""
+        for name, limit in throttler_limits(self.throttle, method, handler).items():
+            if await self.increment(f"{method}:{handler}:{name}:{client}", limit):
+                return True
+        return False
+    
+    async def increment(self, key: str, limit: int) -> bool:
+        """One hit on key; True if it is over limit (RedisThrottlerStorage.increment)"""
+        ttl = int(RATE_LIMIT_WINDOW * 1000)  # blockDuration defaults to the TTL
+        if self.redis is None:
+            now = time.monotonic()
+            hits, reset_at = self.throttle_counts.get(key, (0, 0.0))
+            if reset_at <= now:
+                hits, reset_at = 0, now + RATE_LIMIT_WINDOW
+            self.throttle_counts[key] = (hits + 1, reset_at)
+            return hits + 1 > limit
+        
+        # Same round trips as incrementRedis: block check, INCR+PTTL pipeline, then PEXPIRE / SET as needed
+        block_ttl, = await self.redis.execute(("PTTL", f"block:{key}"))
+        if block_ttl > 0:
+            await self.redis.execute(("GET", key))
+            await self.redis.execute(("PTTL", key))
+            return True
+        hits, time_to_expire = await self.redis.execute(("INCR", key), ("PTTL", key))
+        if hits == 1 or time_to_expire < 0:
+            await self.redis.execute(("PEXPIRE", key, ttl))
+        if hits > limit:
+            await self.redis.execute(("SET", f"block:{key}", "1", "PX", ttl))
+            return True
+        return False
+    
+    def route(self, method: str, path: str, query: Dict, payload: Dict, body: bytes,
+              headers: Dict[str, str], tenant: Optional[str]) -> tuple:
+        handler = {
+            ("POST", "/etl/import"): self.etl_import,
+            ("POST", "/financial/statements"): self.create_statement,
+            ("POST", "/etl/transactions/approve"): self.etl_approve,
+            ("POST", "/etl/transactions/post-to-financials"): self.etl_post,
+            ("POST", "/scenarios"): self.create_scenario,
+            ("POST", "/scenarios/defaults"): self.default_scenarios,
+            ("POST", "/super-admin/tenants"): self.create_tenant,
+            ("POST", "/workflow/requests"): self.create_workflow_request,
+            ("POST", "/version-control/versions"): self.create_version,
+            ("POST", "/consolidation/consolidate"): self.consolidate,
+            ("POST", "/cashflow/forecasts"): self.create_forecast,
+            ("POST", "/projections/generate"): self.generate_projection,
+            ("GET", "/super-admin/analytics/overview"): self.analytics_overview,
+        }.get((method, path))
+        if handler:
+            return handler(tenant, payload, body, headers)
+        if method == "GET" and not all(query.get(name) for name in self.REPORT_PARAMS.get(path, ())):
+            return self.error(400, f"Missing required parameters: {', '.join(self.REPORT_PARAMS[path])}")
+        if method in ("GET", "PUT") and re.fullmatch(r"/financial/statements/[^/]+", path):
+            if method == "PUT":
+                return self.update_statement(tenant, path.rsplit("/", 1)[1], payload)
+            return self.statement_with_lines(tenant, path.rsplit("/", 1)[1])
+        if method == "GET" and re.fullmatch(r"/workflow/requests/[^/]+", path):
+            request = self.collections.get((tenant, "/workflow/requests"), {}).get(path.rsplit("/", 1)[1])
+            return (200, {"data": self.workflow_request(tenant, request)}) if request else self.error(404, "Not found")
+        match = re.fullmatch(r"(/version-control/versions/[^/]+/[^/]+)(?:/(compare|restore))?", path)
+        if match and (method, match.group(2)) in (("GET", None), ("POST", "compare"), ("POST", "restore")):
+            return self.version_history(tenant, match.group(1), match.group(2), query, payload)
+        match = re.fullmatch(r"/dim/dimensions/([^/]+)/hierarchy(?:/([^/]+))?", path)
+        if match and (method, match.group(2) is None) in (("POST", True), ("GET", True), ("GET", False),
+                                                            ("DELETE", False)):
+            return self.dim_hierarchy(tenant, method, match.group(1), match.group(2), payload)
+        match = re.fullmatch(r"/cashflow/forecasts/([^/]+)/(summary|line-items/(\d+))", path)
+        if match and (method, match.group(3) is None) in (("GET", True), ("PUT", False)):
+            if match.group(3) is None:
+                return self.forecast_summary(tenant, match.group(1))
+            return self.update_forecast_week(tenant, match.group(1), int(match.group(3)), payload)
+        if method == "GET" and path.startswith("/super-admin/analytics/tenants/"):
+            return 200, {"data": {"tenant_id": path.split("/")[4], "statements": len(
+                self.collections.get((path.split("/")[4], "/financial/statements"), {}))}}
+        return self.rest(method, path, query, payload, tenant)
+    
+    def rest(self, method: str, path: str, query: Dict, payload: Dict, tenant: Optional[str]) -> tuple:
+        """Generic in-memory CRUD over path-named collections"""
+        parent, _, last = path.rpartition("/")
+        grandparent, _, parent_id = parent.rpartition("/")
+        
+        if method == "POST":
+            return 201, {"data": self.store(tenant, path, payload)}
+        if method == "GET":
+            rows = self.collections.get((tenant, path))
+            item = self.collections.get((tenant, parent), {}).get(last)
+            if item is not None and rows is None:
+                return 200, {"data": item}
+            rows = [
+                row for row in (rows or {}).values()
+                if all(str(row.get(key)) == value for key, value in query.items())
+            ]
+            return 200, {"data": rows, "total": len(rows)}
+        if method in ("PUT", "PATCH"):
+            item = self.collections.get((tenant, parent), {}).get(last)
+            if item is None:  # /collection/:id/<field>
+                item = self.collections.get((tenant, grandparent), {}).get(parent_id)
+            if item is None:
+                return self.error(404, f"Cannot {method} {path}")
+            item.update(payload, updated_at=datetime.now().isoformat())
+            return 200, {"data": item}
+        if method == "DELETE":
+            if self.collections.get((tenant, parent), {}).pop(last, None) is None:
+                return self.error(404, f"Cannot DELETE {path}")
+            return 200, {"data": {"id": last, "deleted": True}}
+        return self.error(404, f"Cannot {method} {path}")
+    
+    def store(self, tenant: Optional[str], collection: str, payload: Dict) -> Dict:
+        item = {"id": str(uuid.uuid4()), "created_at": datetime.now().isoformat()}
+        item.update(payload)
+        self.collections.setdefault((tenant, collection), {})[str(item["id"])] = item
+        return item
+    
+    @staticmethod
+    def json_body(body: bytes, headers: Dict[str, str]) -> Dict:
+        if not body or "json" not in headers.get("content-type", ""):
+            return {}
+        data = json.loads(body)
+        return data if isinstance(data, dict) else {"items": data}
+    
+    @staticmethod
+    def error(status: int, message: str) -> tuple:
+        """NestJS-style error body"""
+        return status, {"statusCode": status, "message": message, "error": StandInBackend.REASONS.get(status)}
+    
+    # ------------------------------------------------------------------
+    # Dedicated handlers
+    # ------------------------------------------------------------------
+    
+    def login(self, body: bytes, client: str) -> tuple:
+        """Issue a token for a known USERS entry; throttle repeated failures per client
+        
+        The failure count stands in for the auth throttler when no
+        throttle profile is enforcing the real one.
+        """
+        now = time.monotonic()
+        failures = [t for t in self.failed_logins.get(client, []) if now - t < STAND_IN_LOGIN_WINDOW]
+        if len(failures) >= STAND_IN_LOGIN_LIMIT and not self.throttle:
+            self.failed_logins[client] = failures
+            return self.error(429, "ThrottlerException: Too Many Requests") + ({"Retry-After": str(STAND_IN_LOGIN_WINDOW)},)
+        
+        try:
+            credentials = json.loads(body or b"{}")
+        except ValueError:
+            credentials = {}
+        for role, user in USERS.items():
+            if credentials.get("username") == user["username"] and credentials.get("password") == user["password"]:
+                return 200, self.issue_token(role), {}
+        
+        self.failed_logins[client] = failures + [now]
+        return self.error(401, "Invalid credentials") + ({},)
+    
+    def issue_token(self, role: str) -> Dict[str, Any]:
+        token = f"stand-in-{role}-{uuid.uuid4().hex}"
+        self.tokens[token] = role
+        self.refresh_tokens[f"refresh-{token}"] = role
+        return {"access_token": token, "refresh_token": f"refresh-{token}", "token_type": "Bearer",
+                "expires_in": STAND_IN_TOKEN_TTL, "refresh_expires_in": STAND_IN_TOKEN_TTL * 2}
+    
+    def refresh(self, body: bytes) -> tuple:
+        try:
+            refresh_token = json.loads(body or b"{}").get("refresh_token")
+        except (ValueError, AttributeError):
+            refresh_token = None
+        role = self.refresh_tokens.pop(refresh_token, None)
+        if role is None:
+            return self.error(401, "Invalid refresh token") + ({},)
+        return 200, self.issue_token(role), {}
+    
+    @staticmethod
+    def count_csv_rows(body: bytes, content_type: str) -> int:
+        """Data rows in a multipart (or raw) CSV upload, excluding the header line"""
+        data = body
+        if "boundary=" in content_type:
+            boundary = b"--" + content_type.split("boundary=", 1)[1].strip('"').encode()
+            for part in body.split(boundary):
+                head, _, content = part.partition(b"\r\n\r\n")
+                if b"filename=" in head:
+                    data = content[:-2] if content.endswith(b"\r\n") else content
+                    break
+        lines = data.count(b"\n") + (0 if data.endswith(b"\n") or not data else 1)
+        return max(lines - 1, 0)
+    
+    def etl_import(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        rows = self.count_csv_rows(body, headers.get("content-type", ""))
+        log = self.store(tenant, "/etl/imports", {
+            "status": "completed", "total_rows": rows, "valid_rows": rows, "invalid_rows": 0,
+            "bytes": len(body)
+        })
+        for _ in range(min(rows, STAND_IN_MAX_TRANSACTIONS)):
+            self.store(tenant, "/etl/transactions", {"log_id": log["id"], "status": "pending"})
+        return 201, {"data": log}
+    
+    def update_transactions(self, tenant: Optional[str], ids: List[str], changes: Dict) -> int:
+        transactions = self.collections.get((tenant, "/etl/transactions"), {})
+        updated = 0
+        for transaction_id in ids:
+            if transaction_id in transactions:
+                transactions[transaction_id].update(changes)
+                updated += 1
+        return updated
+    
+    def etl_approve(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        updated = self.update_transactions(tenant, payload.get("transaction_ids") or [], {"status": "approved"})
+        return 201, {"data": {"approved": updated}}
+    
+    def etl_post(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        statement_id = payload.get("statement_id")
+        if not statement_id:
+            return self.error(400, "statement_id is required")
+        updated = self.update_transactions(
+            tenant, payload.get("transaction_ids") or [], {"status": "posted", "statement_id": statement_id}
+        )
+        return 201, {"data": {"posted": updated, "statement_id": statement_id}}
+    
+    def create_tenant(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """Tenants are addressed by tenant_id (DELETE /super-admin/tenants/:tenant_id)"""
+        tenant_id = payload.get("tenant_id")
+        if not tenant_id:
+            return self.error(400, "tenant_id is required")
+        tenants = self.collections.setdefault((None, "/super-admin/tenants"), {})
+        if tenant_id in tenants:
+            return self.error(409, f"Tenant {tenant_id} already exists")
+        tenants[tenant_id] = dict(payload, id=tenant_id, status="active", created_at=datetime.now().isoformat())
+        return 201, {"data": tenants[tenant_id]}
+    
+    def create_workflow_request(self, tenant: Optional[str], payload: Dict, body: bytes,
+                                headers: Dict[str, str]) -> tuple:
+        request = self.store(tenant, "/workflow/requests", dict(
+            payload, status="pending", current_step=1, request_date=datetime.now().isoformat()))
+        return 201, {"data": request}
+    
+    def workflow_request(self, tenant: Optional[str], request: Dict) -> Dict:
+        """GET /workflow/requests/:id shape: the request with its chain and actions in order"""
+        chain = self.collections.get((tenant, "/workflow/chains"), {}).get(request.get("chain_id"))
+        actions = self.collections.get((tenant, f"/workflow/requests/{request['id']}/actions"), {})
+        return dict(request, chain=chain, actions=sorted(actions.values(), key=lambda a: a["action_date"]))
+    
+    async def workflow_action(self, tenant: Optional[str], request_id: str, payload: Dict, role: str) -> tuple:
+        """WorkflowService.takeAction, including its unlocked read-then-write
+        
+        The backend checks status and step on one connection and writes on
+        another without locking the row; yielding between the two lets
+        concurrent actions interleave the same way.
+        """
+        request = self.collections.get((tenant, "/workflow/requests"), {}).get(request_id)
+        if request is None:
+            return self.error(500, "Approval request not found")
+        status, step = request["status"], request["current_step"]
+        chain = self.collections.get((tenant, "/workflow/chains"), {}).get(request.get("chain_id")) or {}
+        steps = {item.get("step_order") for item in chain.get("steps") or []}
+        if status != "pending":
+            return self.error(500, "Request is not pending")
+        if step not in steps:
+            return self.error(500, "Invalid step")
+        await asyncio.sleep(0)
+        
+        now = datetime.now().isoformat()
+        action = {"id": str(uuid.uuid4()), "request_id": request_id, "step_order": step,
+                  "approver_email": USERS[role]["username"], "action": payload.get("action"),
+                  "action_date": now, "comments": payload.get("comments")}
+        self.collections.setdefault((tenant, f"/workflow/requests/{request_id}/actions"), {})[action["id"]] = action
+        if action["action"] == "reject":
+            request.update(status="rejected", completed_date=now, updated_at=now)
+        elif action["action"] == "approve" and step + 1 in steps:
+            request.update(current_step=step + 1, updated_at=now)
+        elif action["action"] == "approve":
+            request.update(status="approved", completed_date=now, updated_at=now)
+        return 201, {"data": self.workflow_request(tenant, request)}
+    
+    def create_version(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """Numbered MAX(version_number) + 1 per object, like VersionControlService.createVersion"""
+        collection = f"/version-control/versions/{payload.get('object_type')}/{payload.get('object_id')}"
+        versions = self.collections.setdefault((tenant, collection), {})
+        version = dict(payload, id=str(uuid.uuid4()), version_number=len(versions) + 1,
+                       created_by=payload.get("created_by"), created_at=datetime.now().isoformat())
+        versions[str(version["version_number"])] = version
+        return 201, {"data": version}
+    
+    def version_history(self, tenant: Optional[str], collection: str, action: Optional[str],
+                        query: Dict, payload: Dict) -> tuple:
+        """History (newest first, ?limit= default 50), compare and restore for one object"""
+        versions = self.collections.get((tenant, collection), {})
+        if action is None:
+            rows = sorted(versions.values(), key=lambda v: v["version_number"], reverse=True)
+            return 200, {"data": rows[:int(query.get("limit") or 50)]}
+        
+        numbers = [payload.get("version_from"), payload.get("version_to")] if action == "compare" \
+            else [payload.get("version_number")]
+        found = [versions.get(str(number)) for number in numbers]
+        if None in found:
+            missing = numbers[found.index(None)]
+            return self.error(404, f"Version {missing} not found for object {collection.rsplit('/', 1)[1]}")
+        if action == "restore":
+            return 201, {"data": {"restored_data": found[0]["snapshot_data"], "restored_from_version": numbers[0],
+                                  "restored_from_date": found[0]["created_at"], "note": payload.get("restore_note")}}
+        
+        old, new = (version.get("snapshot_data") or {} for version in found)
+        differences = [
+            {"field": key, "old_value": old.get(key), "new_value": new.get(key),
+             "change_type": "added" if not old.get(key) else "removed" if not new.get(key) else "modified"}
+            for key in dict.fromkeys(list(old) + list(new))
+            if json.dumps(old.get(key), sort_keys=True) != json.dumps(new.get(key), sort_keys=True)
+        ]
+        return 201, {"data": {
+            "version_from": numbers[0], "version_to": numbers[1],
+            "version_from_date": found[0]["created_at"], "version_to_date": found[1]["created_at"],
+            "differences": differences,
+            "summary": {"fields_changed": len(differences), "changes_by_field": [d["field"] for d in differences]}
+        }}
+    
+    def create_scenario(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """ScenarioController.createScenario with the frontend's flat body: {scenario, assumptions}"""
+        scenario = self.store(tenant, "/scenarios", dict(
+            payload,
+            scenario_name=payload.get("name") or payload.get("scenario_name") or "Unnamed Scenario",
+            scenario_type=payload.get("scenario_type") or "custom"
+        ))
+        return 201, {"scenario": scenario, "assumptions": []}
+    
+    def default_scenarios(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        created = [
+            self.store(tenant, "/scenarios", {"name": name, "scenario_type": name.lower()})
+            for name in ("Actual", "Budget", "Forecast")
+        ]
+        return 201, {"data": created}
+    
+    def generate_projection(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """ProjectionController.generateProjections: {projection_id, statements, ratios}, no envelope"""
+        for field in ("base_statement_id", "scenario_id"):
+            if not payload.get(field):
+                return self.error(400, f"{field} is required")
+        periods = payload.get("projection_periods")
+        if not isinstance(periods, int) or periods <= 0:
+            return self.error(400, "projection_periods must be a positive integer")
+        base = self.collections.get((tenant, "/financial/statements"), {}).get(payload["base_statement_id"])
+        if base is None:
+            return self.error(404, "Base statement not found")
+        scenario = self.collections.get((tenant, "/scenarios"), {}).get(payload["scenario_id"])
+        if scenario is None:
+            return self.error(404, "Scenario not found")
+        growth = 1 + float((scenario.get("assumptions") or {}).get("revenue_growth_rate") or 0.0) / 12
+        projection = self.store(tenant, "/projections", dict(payload, status="completed"))
+        statements = [
+            {"projection_id": projection["id"], "statement_type": base.get("statement_type"),
+             "period_number": period, "scenario_id": payload["scenario_id"], "line_items": [
+                {"line_code": line.get("line_code"), "line_name": line.get("line_name"),
+                 "base_amount": float(line.get("amount") or 0),
+                 "projected_amount": round(float(line.get("amount") or 0) * growth ** period, 2),
+                 "calculation_method": "growth_rate"}
+                for line in base.get("line_items") or []
+            ]}
+            for period in range(1, periods + 1)
+        ]
+        return 201, {"projection_id": projection["id"], "statements": statements, "ratios": {}}
+    
+    @staticmethod
+    def statement_response(statement: Dict) -> Dict:
+        """FinancialService's {statement, lineItems} shape (line items are stored inline on the row)"""
+        return {
+            "statement": {key: value for key, value in statement.items() if key != "line_items"},
+            "lineItems": [dict(line, statement_id=statement["id"]) for line in statement.get("line_items") or []]
+        }
+    
+    def create_statement(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """FinancialController.createStatement; the controller maps dto.line_items unchecked"""
+        if not isinstance(payload.get("line_items"), list):
+            return self.error(500, "Internal server error")
+        key = tuple(payload.get(field) for field in self.STATEMENT_KEY)
+        if any(tuple(row.get(field) for field in self.STATEMENT_KEY) == key
+               for row in self.collections.get((tenant, "/financial/statements"), {}).values()):
+            return self.error(409, "A statement for this tenant, statement type and period already exists")
+        statement = self.store(tenant, "/financial/statements", dict(payload, status=payload.get("status") or "draft"))
+        return 201, self.statement_response(statement)
+    
+    def update_statement(self, tenant: Optional[str], statement_id: str, payload: Dict) -> tuple:
+        """PUT /financial/statements/:id: set the given fields; line_items, if given, replace every line"""
+        statement = self.collections.get((tenant, "/financial/statements"), {}).get(statement_id)
+        if statement is None:
+            return self.error(500, "Internal server error")
+        statement.update(payload, updated_at=datetime.now().isoformat())
+        return 200, self.statement_response(statement)
+    
+    def statement_with_lines(self, tenant: Optional[str], statement_id: str) -> tuple:
+        statement = self.collections.get((tenant, "/financial/statements"), {}).get(statement_id)
+        if statement is None:
+            return self.error(404, "Statement not found")
+        return 200, self.statement_response(statement)
+    
+    def consolidate(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """ConsolidationController: fetch every statement, sum line items by line_code"""
+        ids = [statement_id for statement_id in payload.get("statement_ids") or [] if statement_id]
+        if not ids:
+            return self.error(400, "statement_ids is required")
+        fetched = []
+        for statement_id in ids:
+            status, response = self.statement_with_lines(tenant, statement_id)
+            if status != 200:
+                return self.error(404, f"Statement not found: {statement_id}")
+            fetched.append(response)
+        
+        totals: Dict[str, Dict] = {}
+        for entry in fetched:
+            for line in entry["lineItems"]:
+                key = str(line.get("line_code") or line.get("line_name") or "UNKNOWN")
+                total = totals.setdefault(key, {"line_code": line.get("line_code"), "line_name": line.get("line_name"),
+                                                "parent_code": line.get("parent_code"), "amount": 0,
+                                                "currency": line.get("currency")})
+                total["amount"] += float(line.get("amount") or 0)
+        return 201, {"data": {"consolidated": {"line_items": list(totals.values())}, "statements": fetched}}
+    
+    def dim_hierarchy(self, tenant: Optional[str], method: str, code: str, node: Optional[str],
+                      payload: Dict) -> tuple:
+        """DimService hierarchy calls: upsert by node_code, flat reads, non-cascading delete"""
+        dimension = next((item for item in self.collections.get((tenant, "/dim/dimensions"), {}).values()
+                          if item.get("dimension_code") == code), None)
+        if dimension is None:
+            return self.error(500, "Dimension not found")
+        nodes = self.collections.setdefault((tenant, f"/dim/dimensions/{code}/hierarchy"), {})
+        if method == "POST":
+            existing = nodes.get(payload.get("node_code")) or {"id": str(uuid.uuid4()),
+                                                                "created_at": datetime.now().isoformat()}
+            nodes[payload.get("node_code")] = dict(existing, **payload, dimension_id=dimension["id"],
+                                                   updated_at=datetime.now().isoformat())
+            return 201, {"data": nodes[payload.get("node_code")]}
+        if method == "DELETE":
+            nodes.pop(node, None)
+            return 200, {"data": {"message": "Hierarchy node deleted successfully"}}
+        rows = [item for item in nodes.values() if node is None or item.get("parent_code") == node]
+        order = (lambda item: (item.get("level", 0), item.get("sort_order", 0), item["node_code"])) if node is None \
+            else (lambda item: (item.get("sort_order", 0), item["node_code"]))
+        return 200, {"data": sorted(rows, key=order)}
+    
+    def create_forecast(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        """Forecast header plus one zeroed line item per week, like CashflowService.create"""
+        forecasts = self.collections.get((tenant, "/cashflow/forecasts"), {})
+        if any(forecast.get("forecast_name") == payload.get("forecast_name") for forecast in forecasts.values()):
+            return self.error(500, f'Forecast with name "{payload.get("forecast_name")}" already exists')
+        forecast = self.store(tenant, "/cashflow/forecasts", dict(
+            payload, weeks=int(payload.get("weeks") or 13), beginning_cash=float(payload.get("beginning_cash") or 0),
+            status="draft"))
+        start = datetime.fromisoformat(str(payload.get("start_date") or datetime.now().date().isoformat()))
+        lines = self.collections.setdefault((tenant, f"/cashflow/forecasts/{forecast['id']}/line-items"), {})
+        for week in range(1, forecast["weeks"] + 1):
+            week_start = start + timedelta(weeks=week - 1)
+            lines[str(week)] = dict(
+                {field: 0.0 for field in CASHFLOW_FIELDS}, id=str(uuid.uuid4()), forecast_id=forecast["id"],
+                week_number=week, week_start_date=week_start.date().isoformat(),
+                week_end_date=(week_start + timedelta(days=6)).date().isoformat())
+        self.recalculate_cash_positions(tenant, forecast)
+        return 201, {"data": dict(forecast, line_items=list(lines.values()))}
+    
+    def recalculate_cash_positions(self, tenant: Optional[str], forecast: Dict):
+        """calculate_forecast_cash_positions(): every week's running cash, from scratch"""
+        running = forecast["beginning_cash"]
+        lines = self.collections.get((tenant, f"/cashflow/forecasts/{forecast['id']}/line-items"), {})
+        for line in sorted(lines.values(), key=lambda item: item["week_number"]):
+            line["net_change_in_cash"] = round(sum(
+                line[field] if field.endswith("inflow") else -line[field] for field in CASHFLOW_FIELDS), 2)
+            line.update(beginning_cash=running, ending_cash=round(running + line["net_change_in_cash"], 2))
+            running = line["ending_cash"]
+    
+    def update_forecast_week(self, tenant: Optional[str], forecast_id: str, week: int, payload: Dict) -> tuple:
+        """One cell save; the recalc_cash_positions trigger then reworks every week"""
+        forecast = self.collections.get((tenant, "/cashflow/forecasts"), {}).get(forecast_id)
+        if forecast is None:
+            return self.error(404, f"Forecast {forecast_id} not found")
+        line = self.collections.get((tenant, f"/cashflow/forecasts/{forecast_id}/line-items"), {}).get(str(week))
+        changes = {field: float(payload[field]) for field in CASHFLOW_FIELDS if payload.get(field) is not None}
+        if line is None:
+            return self.error(500, f"Week {week} not found in forecast")
+        if not changes and "notes" not in payload:
+            return self.error(500, "No fields to update")
+        line.update(changes, updated_at=datetime.now().isoformat(), **(
+            {"notes": payload["notes"]} if "notes" in payload else {}))
+        self.recalculate_cash_positions(tenant, forecast)
+        return 200, {"data": line}
+    
+    def forecast_summary(self, tenant: Optional[str], forecast_id: str) -> tuple:
+        """CashflowService.getForecastSummary: totals over every line item per call"""
+        forecast = self.collections.get((tenant, "/cashflow/forecasts"), {}).get(forecast_id)
+        if forecast is None:
+            return self.error(404, f"Forecast {forecast_id} not found")
+        lines = sorted(self.collections.get((tenant, f"/cashflow/forecasts/{forecast_id}/line-items"), {}).values(),
+                       key=lambda item: item["week_number"])
+        summary = {
+            "forecast_id": forecast_id, "forecast_name": forecast.get("forecast_name"),
+            "start_date": forecast.get("start_date"), "weeks": forecast["weeks"],
+            "beginning_cash": forecast["beginning_cash"],
+            "ending_cash": lines[-1]["ending_cash"] if lines else forecast["beginning_cash"],
+            "lowest_cash_balance": forecast["beginning_cash"], "lowest_cash_week": 0
+        }
+        for field in CASHFLOW_FIELDS:
+            activity, _, direction = field.split("_")
+            summary[f"total_{activity}_{direction}"] = sum(line[field] for line in lines)
+        for line in lines:
+            if line["ending_cash"] < summary["lowest_cash_balance"]:
+                summary.update(lowest_cash_balance=line["ending_cash"], lowest_cash_week=line["week_number"])
+        summary["net_change"] = summary["ending_cash"] - summary["beginning_cash"]
+        return 200, {"data": summary}
+    
+    def analytics_overview(self, tenant: Optional[str], payload: Dict, body: bytes, headers: Dict[str, str]) -> tuple:
+        tenants = self.collections.get((None, "/super-admin/tenants"), {})
+        users = sum(len(rows) for (_, name), rows in self.collections.items() if name.endswith("/users"))
+        return 200, {"data": {"total_tenants": len(tenants), "total_users": users}}
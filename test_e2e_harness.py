@@ -0,0 +1,171 @@
+"""
+Unit tests for the CFO Platform E2E harness (test-company-e2e.py)
+=================================================================
+Covers the latency histogram and route templates every report is built
+on. No backend is needed:
+
+    python3 -m unittest -v test_e2e_harness
+"""
+
+import importlib.util
+import math
+import os
+import unittest
+
+HARNESS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test-company-e2e.py")
+
+spec = importlib.util.spec_from_file_location("test_company_e2e", HARNESS_PATH)
+harness = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(harness)
+
+LatencyHistogram = harness.LatencyHistogram
+LatencyRecorder = harness.LatencyRecorder
+MIN_MS = harness.LATENCY_MIN_MS
+GROWTH = harness.LATENCY_BUCKET_GROWTH
+
+
+def upper_bound(index: int) -> float:
+    return MIN_MS * GROWTH ** index
+
+
+class LatencyHistogramBucketTest(unittest.TestCase):
+    """bucket_index: bucket i covers (MIN * GROWTH^(i-1), MIN * GROWTH^i]"""
+
+    def test_values_at_or_below_minimum_land_in_first_bucket(self):
+        for value in (0.0, MIN_MS / 2, MIN_MS):
+            self.assertEqual(LatencyHistogram.bucket_index(value), 0)
+
+    def test_upper_bound_is_inclusive(self):
+        for index in (1, 10, 250, 900):
+            self.assertEqual(LatencyHistogram.bucket_index(upper_bound(index) * (1 - 1e-12)), index)
+
+    def test_just_above_upper_bound_moves_to_next_bucket(self):
+        for index in (1, 10, 250, 900):
+            self.assertEqual(LatencyHistogram.bucket_index(upper_bound(index) * (1 + 1e-9)), index + 1)
+
+    def test_buckets_are_monotonic(self):
+        values = [MIN_MS * 1.5 ** step for step in range(60)]
+        indexes = [LatencyHistogram.bucket_index(value) for value in values]
+        self.assertEqual(indexes, sorted(indexes))
+
+    def test_bucket_bounds_keep_relative_error(self):
+        for value in (0.05, 1.0, 12.5, 480.0, 30000.0):
+            bound = upper_bound(LatencyHistogram.bucket_index(value))
+            self.assertGreaterEqual(bound, value * (1 - 1e-12))
+            self.assertLessEqual(bound, value * GROWTH * (1 + 1e-12))
+
+
+class LatencyHistogramPercentileTest(unittest.TestCase):
+    """percentile: upper bound of the bucket holding rank ceil(count * pct / 100)"""
+
+    def histogram(self, values):
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        return histogram
+
+    def test_empty_histogram_is_zero(self):
+        self.assertEqual(LatencyHistogram().percentile(50), 0.0)
+        self.assertEqual(LatencyHistogram().percentile(99), 0.0)
+
+    def test_rank_is_ceiling_of_count_times_pct(self):
+        values = [float(value) for value in range(1, 101)]
+        histogram = self.histogram(values)
+        for pct in (1, 50, 90, 99, 99.5):
+            expected = values[math.ceil(len(values) * pct / 100) - 1]
+            bound = upper_bound(LatencyHistogram.bucket_index(expected))
+            self.assertEqual(histogram.percentile(pct), min(bound, histogram.max_ms))
+
+    def test_rank_is_at_least_one(self):
+        histogram = self.histogram([5.0, 50.0, 500.0])
+        self.assertEqual(histogram.percentile(0), histogram.percentile(1))
+        self.assertAlmostEqual(histogram.percentile(0), 5.0, delta=5.0 * (GROWTH - 1))
+
+    def test_percentile_is_clamped_to_observed_range(self):
+        histogram = self.histogram([7.3])
+        for pct in (0, 50, 100):
+            self.assertEqual(histogram.percentile(pct), 7.3)
+
+        # Both share the first bucket, whose upper bound (MIN_MS) is above max
+        histogram = self.histogram([0.001, 0.002])
+        self.assertEqual(histogram.percentile(50), 0.002)
+        self.assertEqual(histogram.percentile(100), 0.002)
+
+    def test_top_percentile_is_max(self):
+        histogram = self.histogram([1.0, 2.0, 3.0, 1000.0])
+        self.assertEqual(histogram.percentile(100), 1000.0)
+
+
+class LatencyHistogramMergeTest(unittest.TestCase):
+
+    def test_merge_matches_recording_everything_once(self):
+        first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in (0.5, 3.0, 3.0, 40.0):
+            first.record(value)
+            combined.record(value)
+        for value in (0.2, 3.0, 900.0):
+            second.record(value)
+            combined.record(value)
+
+        first.merge(second)
+        self.assertEqual(first.buckets, combined.buckets)
+        self.assertEqual(first.count, 7)
+        self.assertEqual(first.min_ms, 0.2)
+        self.assertEqual(first.max_ms, 900.0)
+        self.assertAlmostEqual(first.total_ms, 949.7)
+        self.assertAlmostEqual(first.mean_ms, 949.7 / 7)
+        for pct in (50, 90, 99):
+            self.assertEqual(first.percentile(pct), combined.percentile(pct))
+
+    def test_merge_with_empty_histogram(self):
+        histogram = LatencyHistogram()
+        histogram.record(12.0)
+        histogram.merge(LatencyHistogram())
+        self.assertEqual((histogram.count, histogram.min_ms, histogram.max_ms), (1, 12.0, 12.0))
+
+        empty = LatencyHistogram()
+        empty.merge(histogram)
+        self.assertEqual((empty.count, empty.min_ms, empty.max_ms, empty.total_ms), (1, 12.0, 12.0, 12.0))
+
+
+class NormalizeRouteTest(unittest.TestCase):
+
+    def test_uuid_segments_become_id(self):
+        self.assertEqual(
+            LatencyRecorder.normalize_route("/financial/statements/8f0c2a4e-1b3d-4c5e-9f60-7a8b9c0d1e2f/status"),
+            "/financial/statements/{id}/status"
+        )
+        self.assertEqual(
+            LatencyRecorder.normalize_route("/version-control/8F0C2A4E-1B3D-4C5E-9F60-7A8B9C0D1E2F/history"),
+            "/version-control/{id}/history"
+        )
+
+    def test_numeric_segments_become_id(self):
+        self.assertEqual(LatencyRecorder.normalize_route("/cashflow/forecasts/42/weeks/7"),
+                         "/cashflow/forecasts/{id}/weeks/{id}")
+
+    def test_query_string_is_dropped(self):
+        self.assertEqual(LatencyRecorder.normalize_route("/reports/variance?projection_id=12&period_number=1"),
+                         "/reports/variance")
+
+    def test_other_segments_are_kept(self):
+        for path in ("/v2/financial/statements", "/dim/dimensions/COST_CENTER/hierarchy",
+                     "/super-admin/tenants/load-120000-0001", "/dim/dimensions/BENCH_1_2X4/hierarchy/N12"):
+            self.assertEqual(LatencyRecorder.normalize_route(path), path)
+
+    def test_explicit_route_overrides_template(self):
+        recorder = LatencyRecorder()
+        recorder.record("GET", "/super-admin/tenants/load-120000-0001/users", 0.004,
+                        "/super-admin/tenants/{tenant}/users")
+        recorder.record("GET", "/super-admin/tenants/load-120000-0002/users", 0.006,
+                        "/super-admin/tenants/{tenant}/users")
+        recorder.record("GET", "/financial/statements/17", 0.002)
+        self.assertEqual(
+            sorted(recorder.histograms),
+            [("GET", "/financial/statements/{id}"), ("GET", "/super-admin/tenants/{tenant}/users")]
+        )
+        self.assertEqual(recorder.histograms[("GET", "/super-admin/tenants/{tenant}/users")].count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()